@@ -13,23 +13,24 @@ sub _format {
     my $types = $self->opt('type');
     @$types = split /,/, join ',', @$types;
 
-    # The ExternalSorter will get flattened [chrom, [start, end, ...]]
-    # arrays from the feature_stream
+    # The ExternalSorter will get [chrom, start, -end, [start, end, ...], namerec]
+    # arrays built from the feature_stream.  The sort keys are copied to
+    # the top of each row (end negated, so every key sorts ascending) and
+    # the comparison never has to reach into the flattened feature.
     my $sorter = ExternalSorter->new(
-        do {
-            my $startIndex = $feature_stream->startIndex;
-            my $endIndex = $feature_stream->endIndex;
-            sub ($$) {
-                $_[0]->[0] cmp $_[1]->[0]
-                    ||
-                $_[0]->[1]->[$startIndex] <=> $_[1]->[1]->[$startIndex]
-                    ||
-                $_[1]->[1]->[$endIndex] <=> $_[0]->[1]->[$endIndex];
-            }
+        sub ($$) {
+            $_[0]->[0] cmp $_[1]->[0]
+                ||
+            $_[0]->[1] <=> $_[1]->[1]
+                ||
+            $_[0]->[2] <=> $_[1]->[2];
         },
         $self->opt('sortMem'),
     );
 
+    my $startIndex = $feature_stream->startIndex;
+    my $endIndex = $feature_stream->endIndex;
+
     my %featureCounts;
     while ( my @feats = $feature_stream->next_items ) {
 
@@ -39,8 +40,11 @@ sub _format {
 
             $feat = $self->transform_feature( $feat );
 
+            my $flat = $feature_stream->flatten_to_feature( $feat );
             my $row = [ $chrom,
-                        $feature_stream->flatten_to_feature( $feat ),
+                        $flat->[$startIndex],
+                        -$flat->[$endIndex],
+                        $flat,
                         $feature_stream->flatten_to_name( $feat ),
                         ];
             $sorter->add( $row );
@@ -72,10 +76,10 @@ sub _format {
                              );
         }
         $totalMatches++;
-        $track->addSorted( $feat->[1] );
+        $track->addSorted( $feat->[3] );
 
         # load the feature's name record into the track if necessary
-        if( my $namerec = $feat->[2] ) {
+        if( my $namerec = $feat->[4] ) {
             $track->nameHandler->addName( $namerec );
         }
     }
@@ -22,6 +22,7 @@ sub new {
     return $self;
 }
 
+my %strand_value = ( '+' => 1, '-' => -1 );
 sub flatten_to_feature {
     my ( $self, $f ) = @_;
     my $class = $self->_get_class( $f );
@@ -48,7 +49,7 @@ sub flatten_to_feature {
     $f[2] += 0;
     # convert strand to 1/0/-1/undef if necessary, and numify it
     no warnings 'uninitialized';
-    $f[3] = { '+' => 1, '-' => -1 }->{$f[3]} || $f[3] || undef;
+    $f[3] = $strand_value{$f[3]} || $f[3] || undef;
     $f[3] += 0;
     return \@f;
 }
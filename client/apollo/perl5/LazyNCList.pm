@@ -37,6 +37,8 @@ sub new {
     my $self = { attrs => $attrs,
 	         start => $attrs->makeFastGetter("Start"),
                  end => $attrs->makeFastGetter("End"),
+                 getChunk => $attrs->makeGetter("Chunk"),
+                 getSublist => $attrs->makeGetter("Sublist"),
                  setSublist => $attrs->makeSetter("Sublist"),
 		 lazyClass => $lazyClass,
                  makeLazy => $makeLazy,
@@ -65,6 +67,8 @@ sub importExisting {
 		 lazyClass => $lazyClass,
 		 start => $attrs->makeFastGetter("Start"),
                  end => $attrs->makeFastGetter("End"),
+                 getChunk => $attrs->makeGetter("Chunk"),
+                 getSublist => $attrs->makeGetter("Sublist"),
                  count => $count,
                  minStart => $minStart,
                  maxEnd => $maxEnd,
@@ -94,40 +98,47 @@ sub addSorted {
     my ($self, $feat) = @_;
 
     $self->{count} += 1;
-    my $lastAdded = $self->{lastAdded};
     my $start = $self->{start}->( $feat );
     my $end = $self->{end}->( $feat );
 
-    if (defined($lastAdded)) {
-        my $lastStart = $self->{start}->($lastAdded);
-        my $lastEnd = $self->{end}->($lastAdded);
-        # check that the input is sorted
-        $lastStart <= $start
-            or die "input not sorted: got start $lastStart before $start";
-
-        die "input not sorted: got $lastStart..$lastEnd before $start..$end"
-            if $lastStart == $start && $lastEnd < $end;
+    if (defined($self->{lastStart})) {
+        my $lastStart = $self->{lastStart};
+        my $lastEnd = $self->{lastEnd};
+        # check that the input is sorted; features usually start after
+        # the previous one, so the common case is a single comparison
+        if ($start <= $lastStart) {
+            $lastStart == $start
+                or die "input not sorted: got start $lastStart before $start";
+
+            die "input not sorted: got $lastStart..$lastEnd before $start..$end"
+                if $lastEnd < $end;
+        }
     } else {
         # LazyNCList requires sorted input, so the start of the first feat
         # is the minStart
         $self->{minStart} = $start;
     }
 
-    $self->{lastAdded} = $feat;
+    # remember the previous feature's coordinates, rather than the
+    # feature itself, so the next sort check doesn't have to look them up
+    $self->{lastStart} = $start;
+    $self->{lastEnd} = $end;
 
     my $chunkSizes   = $self->{chunkSizes};
     my $partialStack = $self->{partialStack};
+    my $measure      = $self->{measure};
+    my $sizeThresh   = $self->{sizeThresh};
 
     for (my $level = 0; $level <= $#$partialStack; $level++) {
         # due to NCList nesting, among other things, it's hard to be exactly
         # precise about the size of the JSON serialization, but this will get
         # us pretty close.
-        my $featSize     = $self->{measure}->($feat);
+        my $featSize     = $measure->($feat);
         my $proposedChunkSize = $chunkSizes->[$level] + $featSize;
         #print STDERR "chunksize at $level is now " . $chunkSizes->[$level] . "; (next chunk is " . $self->{chunkNum} . ")\n";
 
         # If this partial chunk is full,
-        if ( $proposedChunkSize > $self->{sizeThresh} && @{$partialStack->[$level]} ){
+        if ( $proposedChunkSize > $sizeThresh && @{$partialStack->[$level]} ){
             # then we're finished with the current "partial" chunk (i.e.,
             # it's now a "complete" chunk rather than a partial one), so
             # create a new NCList to hold all the features in this chunk.
@@ -141,7 +152,7 @@ sub addSorted {
             $feat = $lazyFeat;
 
             # if we're already at the highest level,
-            if ($level == $#{$self->{partialStack}}) {
+            if ($level == $#$partialStack) {
                 # then we need to make a new level to have somewhere to put
                 # the new lazy feat
                 $self->addNewLevel();
@@ -239,8 +250,8 @@ sub iterHelper {
         $searchGet, $testGet, $path) = @_;
     my $len = $#{$arr} + 1;
     my $i = $self->binarySearch($arr, $from, $searchGet);
-    my $getChunk = $self->{attrs}->makeGetter("Chunk");
-    my $getSublist = $self->{attrs}->makeGetter("Sublist");
+    my $getChunk = $self->{getChunk};
+    my $getSublist = $self->{getSublist};
 
     while (($i < $len)
            && ($i >= 0)
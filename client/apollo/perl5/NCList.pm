@@ -9,7 +9,6 @@ package NCList;
 
 use strict;
 use warnings;
-use List::Util qw(max);
 
 =head2 new
 
@@ -34,38 +33,44 @@ use List::Util qw(max);
 sub new {
     my ($class, $start, $end, $setSublist, $featList) = @_;
 
-    my @features = sort {
-	if ($start->($a) != $start->($b)) {
-	    $start->($a) - $start->($b);
-	} else {
-	    $end->($b) - $end->($a);
-	}
-    } @$featList;
+    #look up each feature's start and end once, rather than calling
+    #the getters again for every comparison the sort makes
+    my @starts = map { $start->($_) } @$featList;
+    my @ends   = map { $end->($_) } @$featList;
+    my @order  = _sortOrder(\@starts, \@ends);
+
+    #keep the sorted features and their ends in parallel arrays, so the
+    #loop below reads ends directly instead of going through $end
+    my @features = @{$featList}[@order];
+    @ends        = @ends[@order];
 
     #@sublistStack is a list of all the currently relevant sublists
     #(one for each level of nesting)
     my @sublistStack;
+    #@stackEnd holds the end of the last interval in each list on
+    #@sublistStack (those lists don't change while they're on the stack)
+    my @stackEnd;
     #$curlist is the currently active sublist
     my $curList = [];
 
     my $self = { 'topList'    => $curList,
 		 'setSublist' => $setSublist,
 	         'count'      => scalar( @features ),
-                 'minStart'   => ( @features ? $start->($features[0]) : undef ),
+                 'minStart'   => ( @order ? $starts[$order[0]] : undef ),
                };
     bless $self, $class;
 
     push @$curList, $features[0] if @features;
 
-    my $maxEnd = @features ? $end->($features[0]) : undef;
+    my $maxEnd = @features ? $ends[0] : undef;
 
-    my $topSublist;
     for (my $i = 1; $i < @features; $i++) {
-        $maxEnd = max( $maxEnd, $end->( $features[$i] ));
+        $maxEnd = $ends[$i] if $ends[$i] > $maxEnd;
 	#if this interval is contained in the previous interval,
-	if ($end->($features[$i]) < $end->($features[$i - 1])) {
+	if ($ends[$i] < $ends[$i - 1]) {
 	    #create a new sublist starting with this interval
 	    push @sublistStack, $curList;
+	    push @stackEnd, $ends[$i - 1];
 	    $curList = [$features[$i]];
             $setSublist->($features[$i - 1], $curList);
 	} else {
@@ -77,11 +82,9 @@ sub new {
 		    push @$curList, $features[$i];
 		    last;
 		} else {
-		    $topSublist = $sublistStack[$#sublistStack];
                     #if the last interval in the top sublist ends
                     #after the end of the current interval,
-		    if ($end->($topSublist->[$#{$topSublist}])
-                        > $end->($features[$i]) ) {
+		    if ($stackEnd[$#stackEnd] > $ends[$i]) {
 			#then curList is the first (deepest) sublist
                         #that the current feature fits into, and
                         #we add the current feature to curList
@@ -90,6 +93,7 @@ sub new {
 		    } else {
                         #move on to the next shallower sublist
 			$curList = pop @sublistStack;
+			pop @stackEnd;
 		    }
 		}
 	    }
@@ -101,6 +105,41 @@ sub new {
     return $self;
 }
 
+#returns the indices of the given intervals in NCList order
+#(by start, then by descending end)
+sub _sortOrder {
+    my ($starts, $ends) = @_;
+
+    #LazyNCList builds its chunks from features that are already sorted,
+    #so check for that first and skip the sort when it isn't needed
+    my $i;
+    for ($i = 1; $i < @$starts; $i++) {
+        last if $starts->[$i] < $starts->[$i - 1]
+             || ($starts->[$i] == $starts->[$i - 1]
+                 && $ends->[$i] > $ends->[$i - 1]);
+    }
+    return 0..$#$starts if $i >= @$starts;
+
+    #if all the coordinates fit in 32 bits, pack (start, ~end, index)
+    #into one string per interval, so that perl's built-in string sort
+    #does the whole comparison without calling back into a sort block
+    my $max = 0xFFFFFFFF;
+    for ($i = 0; $i < @$starts; $i++) {
+        my ($s, $e) = ($starts->[$i], $ends->[$i]);
+        last unless $s >= 0 && $s <= $max && $s == int($s)
+                 && $e >= 0 && $e <= $max && $e == int($e);
+    }
+    if ($i == @$starts) {
+        return map { unpack('x8 N', $_) }
+               sort
+               map { pack('NNN', $starts->[$_], $max - $ends->[$_], $_) }
+               0..$#$starts;
+    }
+
+    return sort { $starts->[$a] <=> $starts->[$b]
+                      || $ends->[$b] <=> $ends->[$a] } 0..$#$starts;
+}
+
 sub maxEnd {
     return shift->{maxEnd};
 }
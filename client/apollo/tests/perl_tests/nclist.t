@@ -0,0 +1,96 @@
+use strict;
+use warnings;
+
+use JBlibs;
+
+use Test::More;
+
+use ArrayRepr;
+use NCList;
+use LazyNCList;
+
+my $attrs = ArrayRepr->new([
+    { attributes => [ 'Start', 'End', 'Name', 'Sublist' ] },
+    { attributes => [ 'Start', 'End', 'Chunk' ], isArrayAttr => { Sublist => 1 } },
+]);
+my $getStart   = $attrs->makeFastGetter('Start');
+my $getEnd     = $attrs->makeFastGetter('End');
+my $setSublist = $attrs->makeSetter('Sublist');
+
+# features are [class, start, end, name]; NCList->new sets sublists on the
+# arrays it is given, so every build gets fresh copies
+sub build {
+    my ( $feats ) = @_;
+    return NCList->new( $getStart, $getEnd, $setSublist,
+                        [ map [ 0, @$_ ], @$feats ] );
+}
+
+sub nclist_is {
+    my ( $feats, $expected, $minStart, $maxEnd, $name ) = @_;
+    my $ncl = build( $feats );
+    is_deeply( $ncl->nestedList, $expected, "$name: nested list" )
+        or diag explain $ncl->nestedList;
+    is( $ncl->minStart, $minStart, "$name: minStart" );
+    is( $ncl->maxEnd, $maxEnd, "$name: maxEnd" );
+}
+
+{
+    my @sorted = ( [ 1, 10, 'a' ], [ 2, 5, 'b' ], [ 3, 4, 'c' ],
+                   [ 6, 12, 'd' ], [ 11, 15, 'e' ] );
+    my $expected = [
+        [ 0, 1, 10, 'a', [ [ 0, 2, 5, 'b', [ [ 0, 3, 4, 'c' ] ] ] ] ],
+        [ 0, 6, 12, 'd' ],
+        [ 0, 11, 15, 'e' ],
+    ];
+    nclist_is( \@sorted, $expected, 1, 15, 'sorted input' );
+    nclist_is( [ @sorted[ 3, 0, 4, 2, 1 ] ], $expected, 1, 15, 'unsorted input' );
+    is_deeply( build( [ reverse @sorted ] )->nestedList,
+               build( \@sorted )->nestedList,
+               'already-ordered input builds the same list as a shuffled copy' );
+}
+
+nclist_is( [ [ 5, 8, 'short' ], [ 5, 20, 'long' ], [ 5, 12, 'mid' ] ],
+           [ [ 0, 5, 20, 'long', [ [ 0, 5, 12, 'mid', [ [ 0, 5, 8, 'short' ] ] ] ] ] ],
+           5, 20, 'equal starts, differing ends' );
+
+nclist_is( [ [ 9, 10, 'z' ], [ 1, 5, 'b' ], [ 1, 5, 'a' ], [ 1, 5, 'c' ] ],
+           [ [ 0, 1, 5, 'b' ], [ 0, 1, 5, 'a' ], [ 0, 1, 5, 'c' ], [ 0, 9, 10, 'z' ] ],
+           1, 10, 'identical intervals keep their input order' );
+
+# negative, over-32-bit and fractional coordinates can't use the packed sort
+nclist_is( [ [ 2**33, 2**33 + 5, 'big' ], [ 0.5, 2, 'half' ],
+             [ -5, 3, 'neg' ], [ 0.25, 1, 'quarter' ] ],
+           [ [ 0, -5, 3, 'neg', [ [ 0, 0.25, 1, 'quarter' ], [ 0, 0.5, 2, 'half' ] ] ],
+             [ 0, 2**33, 2**33 + 5, 'big' ] ],
+           -5, 2**33 + 5, 'coordinates outside the packed key range' );
+
+{
+    # with one-byte features and a three-byte chunk size, the first chunk
+    # holds the three features at 0 and the second starts at 0 too but
+    # ends later, so the lazy features for the two chunks reach the top
+    # level out of NCList order
+    my %chunks;
+    my $lazy = LazyNCList->new( $attrs, 1,
+                                sub { [ 1, @_ ] },
+                                sub { $chunks{ $_[0] } },
+                                sub { 1 },
+                                sub { $chunks{ $_[1] } = $_[0] },
+                                3 );
+    $lazy->addSorted( [ 0, @$_ ] ) for [ 0, 100, 'a' ], [ 0, 90, 'b' ],
+        [ 0, 80, 'c' ], [ 0, 70, 'd' ], [ 5, 500, 'e' ];
+    $lazy->finish;
+
+    is_deeply( $lazy->topLevelList,
+               [ [ 1, 0, 500, 2, { Sublist => [ [ 1, 0, 100, 1 ] ] } ] ],
+               'top-level lazy features come out in NCList order' )
+        or diag explain $lazy->topLevelList;
+    is( $lazy->minStart, 0, 'lazy minStart' );
+    is( $lazy->maxEnd, 500, 'lazy maxEnd' );
+
+    my @found;
+    $lazy->overlapCallback( 0, 1000, sub { push @found, $_[0][3] } );
+    is_deeply( [ sort @found ], [qw( a b c d e )],
+               'overlap query finds every feature through the chunks' );
+}
+
+done_testing;